@@ -176,8 +176,8 @@ class PredictionController(QObject):
         finally:
             loading.deleteLater()
 
-    @asyncSlot(int, int, int, list)
-    async def __predict_match_score(self, home_id: int, away_id: int, match_id: int, code: list) -> None:
+    @asyncSlot(int, int, int, int)
+    async def __predict_match_score(self, home_id: int, away_id: int, match_id: int, code: int) -> None:
         """
         Predict the score for a match using selected models.
 
@@ -185,7 +185,7 @@ class PredictionController(QObject):
             home_id (int): Home team ID.
             away_id (int): Away team ID.
             match_id (int): Match ID.
-            code (list): List of model selection flags (1 for selected, 0 for not selected).
+            code (int): Bitmask of model selection flags (bit i set = model i selected).
         """
         loading = LoadingWidget(resource_path("./Assets/loading.gif"), "Predicting score...")
         self.switch_to_view.emit(loading)
@@ -228,9 +228,9 @@ class StatisticsController(QObject):
         Refresh a specific team view with fetched data and switch to it.
 
         Args:
-            data (list): List of team statistics data.
+            data (list): [team_json, results] from the model.
         """
-        self.__team_view.refresh_view(data)
+        self.__team_view.refresh_view(*data)
         self.switch_to_view.emit(self.__team_view)
 
     def __refresh_prediction_statistics_view(self, data: list) -> None:
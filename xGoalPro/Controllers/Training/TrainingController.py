@@ -1,6 +1,8 @@
+import asyncio
+
 from PyQt5.QtCore import QObject, pyqtSignal
-from threading import Thread
 from PyQt5.QtWidgets import QWidget
+from qasync import asyncSlot
 from Model.TrainingModel import TrainingModel
 from View.Training.TrainingEditView import TrainingEditView
 from View.Training.TrainingLoadingView import TrainingLoadingView
@@ -59,11 +61,15 @@ class TrainingController(QObject):
         self.__model.log_message.connect(self.__loading_view.append_log)
         self.__model.training_finished.connect(self.__on_training_finished)
 
-    def __start_training(self) -> None:
+    @asyncSlot()
+    async def __start_training(self) -> None:
         """
-        Start SVR training in a separate thread using parameters from the edit view.
+        Run SVR training on the default executor using parameters from the edit view.
 
-        Disables the loading view button and switches to the loading view while training.
+        Disables the loading view button and switches to the loading view while
+        training; run_in_executor keeps the scikit-learn fit off the GUI thread
+        while reusing the loop's worker pool instead of spawning a fresh Thread
+        per run. Log and completion signals cross back via queued connections.
         """
         team = self.__edit_view.team_input.text()
         y_from = self.__edit_view.year_from.value()
@@ -78,8 +84,11 @@ class TrainingController(QObject):
 
         self.switch_to_view.emit(self.__loading_view)
         self.__loading_view.disable_button()
-        thread = Thread(target=self.__model.train_svr, args=(team, y_from, y_to, param_ranges))
-        thread.start()
+        self.__loading_view.start_logging()
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(
+            None, self.__model.train_svr, team, y_from, y_to, param_ranges
+        )
 
     def __on_training_finished(self, success, message) -> None:
         """
@@ -237,14 +237,14 @@ class PredictionModel:
             print("Error in fetch_matches:", e)
             return False, [str(e)]
 
-    async def predict_scores(self, home_id: int, away_id: int, match_id: int, code: list) -> Optional[Tuple[bool, Any]]:
+    async def predict_scores(self, home_id: int, away_id: int, match_id: int, code: int) -> Optional[Tuple[bool, Any]]:
         """Predict match scores and probabilities using ML models.
 
         Args:
             home_id (int): Home team ID.
             away_id (int): Away team ID.
             match_id (int): Match ID.
-            code (list): Binary list indicating which ML models to use for prediction.
+            code (int): Bitmask indicating which ML models to use for prediction.
 
         Returns:
             Optional[Tuple[bool, Any]]: 
@@ -286,8 +286,8 @@ class PredictionModel:
             predictions = await self.__make_prediction(code, features)
 
             code_str = ""
-            for value in code:
-                code_str += str(value)
+            for i in range(len(self.__ml_models)):
+                code_str += "1" if code & (1 << i) else "0"
 
             await self.__storage.insert_prediction(
                 match_id, code_str, home_id, predictions['Expected_Home_Goals'],
@@ -385,11 +385,11 @@ class PredictionModel:
             "losses": losses,
         }
 
-    async def __make_prediction(self, code: list, features: list) -> dict:
+    async def __make_prediction(self, code: int, features: list) -> dict:
         """Predict expected goals and match outcome probabilities using ML models.
 
         Args:
-            code (list): Binary list indicating which ML models to use.
+            code (int): Bitmask indicating which ML models to use.
             features (list): Feature vector for prediction.
 
         Returns:
@@ -407,7 +407,7 @@ class PredictionModel:
             away_xg = []
 
             for i, (key, (paths, _)) in enumerate(self.__ml_models.items()):
-                if code[i]:
+                if code & (1 << i):
                     home_model = joblib.load(resource_path(paths[0]))
                     home_result = home_model.predict(features_scaled)
                     home_xg.append(home_result.item())
@@ -1,9 +1,16 @@
+import functools
 import sys
 import os
 
 
+@functools.lru_cache(maxsize=None)
 def resource_path(relative_path):
-    """ Get absolute path to resource, works for dev and for PyInstaller """
+    """ Get absolute path to resource, works for dev and for PyInstaller
+
+    The base path is fixed for the lifetime of the process, so each
+    relative path is resolved once and served from the cache afterwards
+    (view constructors call this on every navigation).
+    """
     try:
         # PyInstaller creates a temp folder and stores path in _MEIPASS
         base_path = sys._MEIPASS2
@@ -11,3 +18,33 @@ def resource_path(relative_path):
         base_path = os.path.abspath(".")
 
     return os.path.join(base_path, relative_path)
+
+
+# Stylesheet contents keyed by absolute path, with the mtime they were
+# read at; re-instantiating a view skips the disk read entirely.
+_QSS_CACHE = {}
+
+
+def load_qss(relative_path):
+    """Read a .qss file through an mtime-validated in-memory cache.
+
+    Args:
+        relative_path (str): Path relative to the resource root.
+
+    Returns:
+        str: The stylesheet contents, or an empty string if the file is missing.
+    """
+    qss_path = resource_path(relative_path)
+    try:
+        mtime = os.stat(qss_path).st_mtime
+    except OSError:
+        return ""
+
+    entry = _QSS_CACHE.get(qss_path)
+    if entry is not None and entry[0] == mtime:
+        return entry[1]
+
+    with open(qss_path, "r") as f:
+        qss = f.read()
+    _QSS_CACHE[qss_path] = (mtime, qss)
+    return qss
@@ -207,7 +207,7 @@ async def test_predict_scores_success(model, mock_api, mock_storage):
     mock_model.predict.return_value = np.array([1.0])
 
     with patch("joblib.load", side_effect=[mock_scaler, mock_model, mock_model]):
-        ok, pred = await model.predict_scores(1, 2, 123, [1])
+        ok, pred = await model.predict_scores(1, 2, 123, 0b1)
 
     assert ok
     assert "Expected_Home_Goals" in pred
@@ -220,7 +220,7 @@ async def test_predict_scores_success(model, mock_api, mock_storage):
 @pytest.mark.asyncio
 async def test_predict_scores_rate_limit(model, mock_api):
     mock_api.get.side_effect = ClientResponseError(None, None, status=429)
-    ok, msg = await model.predict_scores(1, 2, 123, [1])
+    ok, msg = await model.predict_scores(1, 2, 123, 0b1)
     assert not ok
     assert "Too many requests" in msg[0]
 
@@ -231,7 +231,7 @@ async def test_predict_scores_rate_limit(model, mock_api):
 @pytest.mark.asyncio
 async def test_predict_scores_generic_exception(model, mock_api):
     mock_api.get.side_effect = Exception("boom")
-    ok, msg = await model.predict_scores(1, 2, 123, [1])
+    ok, msg = await model.predict_scores(1, 2, 123, 0b1)
     assert not ok
     assert "boom" in msg[0]
 
@@ -0,0 +1,41 @@
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal, Qt
+from PyQt5.QtGui import QImage
+
+
+class _DecodeSignals(QObject):
+    """Signal holder for PixmapDecodeTask (QRunnable cannot own signals)."""
+    finished = pyqtSignal(QImage)
+
+
+class PixmapDecodeTask(QRunnable):
+    """
+    Decode and scale image bytes off the GUI thread.
+
+    QImage is reentrant, so the decode + scale can run on a QThreadPool
+    worker; the finished QImage is emitted back and the receiver does the
+    cheap QPixmap.fromImage + setPixmap on the GUI thread. Submitting one
+    task per card keeps the event loop responsive while a whole grid of
+    emblems is loading.
+    """
+
+    def __init__(self, data: bytes, width: int, height: int, smooth: bool = False):
+        super().__init__()
+        self.signals = _DecodeSignals()
+        self._data = data
+        self._width = width
+        self._height = height
+        self._mode = Qt.SmoothTransformation if smooth else Qt.FastTransformation
+
+    def run(self) -> None:
+        img = QImage()
+        img.loadFromData(self._data)
+        if not img.isNull():
+            img = img.scaled(self._width, self._height,
+                             Qt.KeepAspectRatio, self._mode)
+        try:
+            self.signals.finished.emit(img)
+        except RuntimeError:
+            # The signal holder can be collected during interpreter
+            # teardown while a decode is still in flight; a late emit
+            # must not abort process exit.
+            pass
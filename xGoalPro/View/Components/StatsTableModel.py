@@ -0,0 +1,210 @@
+from contextlib import contextmanager
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QThreadPool
+from PyQt5.QtGui import QPixmap, QIcon, QPixmapCache
+from View.Components.PixmapLoader import PixmapDecodeTask
+
+# Room for a few hundred scaled emblems (the default 10 MB fills up fast
+# when several league tables are browsed in one session).
+QPixmapCache.setCacheLimit(20480)
+
+# Role constants resolved once at import; data() compares against these
+# locals-of-the-module instead of doing Qt.<attr> lookups per visible cell.
+_DISPLAY = Qt.DisplayRole
+_ALIGNMENT = Qt.TextAlignmentRole
+_DECORATION = Qt.DecorationRole
+
+
+@contextmanager
+def populate_guard(table):
+    """Suppress repaints, signals and sorting while a table is repopulated.
+
+    Restores the previous sorting state on exit and schedules one final
+    viewport repaint instead of one per change.
+    """
+    table.setUpdatesEnabled(False)
+    table.blockSignals(True)
+    prev_sort = table.isSortingEnabled()
+    table.setSortingEnabled(False)
+    try:
+        yield
+    finally:
+        table.setSortingEnabled(prev_sort)
+        table.blockSignals(False)
+        table.setUpdatesEnabled(True)
+        table.viewport().update()
+
+
+class StatsTableModel(QAbstractTableModel):
+    """
+    Read-only table model over a list of row dicts.
+
+    Replaces the QTableWidget populate loops in the statistics views: Qt
+    asks data() only for the cells that are actually visible, so a
+    refresh never allocates a QTableWidgetItem per cell — it just swaps
+    the row list behind a model reset.
+
+    Args:
+        headers (list): Column titles, in display order.
+        keys (tuple): Dict key backing each column.
+        tooltips (list): Optional per-column header tooltips.
+        left_cols (tuple): Column indexes aligned left; all others center.
+        icon_cols (dict): Optional {column: (ident_key, emblem_key)} map;
+            the column shows the row's emblem bytes as a cached icon,
+            skipped for rows that carry no emblem data.
+        int_cols (tuple): Column indexes whose values are handed to Qt as
+            raw ints — no per-cell str() and numeric sort order.
+    """
+
+    def __init__(self, headers, keys, tooltips=None, left_cols=(),
+                 icon_cols=None, int_cols=(), parent=None):
+        super().__init__(parent)
+        self._headers = tuple(headers)
+        self._keys = tuple(keys)
+        self._tooltips = tuple(tooltips) if tooltips else None
+        # Alignment flags resolved once per column instead of branching
+        # in data() for every visible cell.
+        left = frozenset(left_cols)
+        self._aligns = tuple(
+            int(Qt.AlignVCenter | Qt.AlignLeft) if col in left else int(Qt.AlignCenter)
+            for col in range(len(self._headers))
+        )
+        self._icon_cols = icon_cols or {}
+        self._int_cols = frozenset(int_cols)
+        self._rows = []
+        self._cells = []
+        self._row_sigs = []
+        # In-flight emblem decodes: signal holder -> (cache key, row, col),
+        # plus the keys themselves so a cell repainted while its decode is
+        # still running does not submit a second task.
+        self._pending_icons = {}
+        self._pending_keys = set()
+
+    def update(self, rows) -> None:
+        """Swap in new rows, notifying only about what actually changed.
+
+        Rows are compared by a hash over their displayed values: ranges
+        whose hash differs get a dataChanged signal, added/removed tails
+        go through begin/endInsertRows / begin/endRemoveRows, and a
+        refresh with identical data emits nothing at all. A full model
+        reset (which drops selection and scroll position) only happens
+        when the table was empty before.
+        """
+        rows = list(rows)
+        # Each row dict is flattened into a positional tuple exactly once
+        # here; data() then indexes the tuple instead of hashing a dict
+        # key per visible cell, and the row hashes fall out for free.
+        get = dict.get
+        keys = self._keys
+        cells = [tuple(get(row, key, "") for key in keys) for row in rows]
+        new_sigs = list(map(hash, cells))
+        old_n, new_n = len(self._rows), len(rows)
+
+        if old_n == 0 or new_n == 0:
+            self.beginResetModel()
+            self._rows = rows
+            self._cells = cells
+            self._row_sigs = new_sigs
+            self.endResetModel()
+            return
+
+        if new_n < old_n:
+            self.beginRemoveRows(QModelIndex(), new_n, old_n - 1)
+            del self._rows[new_n:]
+            del self._cells[new_n:]
+            self.endRemoveRows()
+
+        common = min(old_n, new_n)
+        old_sigs = self._row_sigs
+        self._rows[:common] = rows[:common]
+        self._cells[:common] = cells[:common]
+        # Bound methods hoisted out of the scan; the loop body is pure
+        # local loads for rows whose signature is unchanged.
+        make_index = self.index
+        emit_changed = self.dataChanged.emit
+        last_col = len(self._headers) - 1
+        row = 0
+        while row < common:
+            if new_sigs[row] != old_sigs[row]:
+                first = row
+                while row < common and new_sigs[row] != old_sigs[row]:
+                    row += 1
+                emit_changed(make_index(first, 0),
+                             make_index(row - 1, last_col))
+            else:
+                row += 1
+
+        if new_n > old_n:
+            self.beginInsertRows(QModelIndex(), old_n, new_n - 1)
+            self._rows.extend(rows[old_n:])
+            self._cells.extend(cells[old_n:])
+            self.endInsertRows()
+
+        self._row_sigs = new_sigs
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal:
+            if role == Qt.DisplayRole:
+                return self._headers[section]
+            if role == Qt.ToolTipRole and self._tooltips:
+                return self._tooltips[section]
+        return None
+
+    def data(self, index, role=_DISPLAY):
+        if not index.isValid():
+            return None
+        if role == _DISPLAY:
+            value = self._cells[index.row()][index.column()]
+            if index.column() in self._int_cols:
+                return int(value)
+            return str(value)
+        if role == _ALIGNMENT:
+            return self._aligns[index.column()]
+        if role == _DECORATION and index.column() in self._icon_cols:
+            ident_key, emblem_key = self._icon_cols[index.column()]
+            row = self._rows[index.row()]
+            data = row.get(emblem_key)
+            if data:
+                return self._icon_or_decode(f"emblem24:{row.get(ident_key)}",
+                                            data, index.row(), index.column())
+        return None
+
+    def _icon_or_decode(self, key, data, row, col):
+        """Icon from QPixmapCache, scheduling an off-thread decode on miss.
+
+        A miss leaves the cell undecorated and hands the PNG decode +
+        smooth downscale to the global QThreadPool, so first-time emblems
+        never block the GUI thread mid-paint. The worker delivers a
+        QImage back via queued signal; _on_emblem_decoded does the
+        QPixmap conversion and repaints just that cell.
+        """
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
+            return QIcon(pixmap)
+        if key not in self._pending_keys:
+            self._pending_keys.add(key)
+            task = PixmapDecodeTask(data, 24, 24, smooth=True)
+            self._pending_icons[task.signals] = (key, row, col)
+            task.signals.finished.connect(self._on_emblem_decoded)
+            QThreadPool.globalInstance().start(task)
+        return None
+
+    def _on_emblem_decoded(self, image):
+        """GUI-thread slot: cache the decoded emblem and repaint its cell."""
+        entry = self._pending_icons.pop(self.sender(), None)
+        if entry is None:
+            return
+        key, row, col = entry
+        self._pending_keys.discard(key)
+        if image.isNull():
+            return
+        QPixmapCache.insert(key, QPixmap.fromImage(image))
+        if row < len(self._rows):
+            cell = self.index(row, col)
+            self.dataChanged.emit(cell, cell, [Qt.DecorationRole])
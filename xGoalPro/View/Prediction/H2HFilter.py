@@ -0,0 +1,29 @@
+import numpy as np
+
+
+# Cap on how many H2H cards are built per refresh; matches the API fetch limit.
+H2H_CARD_LIMIT = 50
+
+
+def top_k_recent_indices(dates: list, k: int = H2H_CARD_LIMIT) -> np.ndarray:
+    """Return indices of the k most recent matches, newest first.
+
+    Selection runs on a numpy string array instead of sorting Python dicts,
+    so the reshaping happens in compiled code and the Qt thread stays
+    unblocked. ISO-8601 date strings compare chronologically, so no parsing
+    is needed.
+
+    Args:
+        dates (list): ISO-8601 date strings, one per match.
+        k (int): Maximum number of indices to return.
+
+    Returns:
+        np.ndarray: Indices into `dates`, most recent first.
+    """
+    arr = np.asarray(dates)
+    if arr.size <= k:
+        return np.argsort(arr)[::-1]
+    # argpartition isolates the k most recent in O(n), then only those k
+    # are fully sorted.
+    idx = np.argpartition(arr, arr.size - k)[arr.size - k:]
+    return idx[np.argsort(arr[idx])[::-1]]
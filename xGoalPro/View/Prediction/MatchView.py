@@ -1,49 +1,12 @@
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QScrollArea, QGridLayout, QTabWidget, QCheckBox, QFrame, QSizePolicy, QSpacerItem
+    QGridLayout, QTabWidget, QCheckBox, QFrame, QSizePolicy, QSpacerItem,
+    QTableView, QHeaderView, QAbstractItemView
 )
-from PyQt5.QtCore import pyqtSignal, Qt
-from PyQt5.QtGui import QPixmap
-import os
-from ResourcePath import resource_path
-
-
-class MatchH2HCard(QWidget):
-    """
-    Widget representing a Head-to-Head (H2H) match summary.
-
-    Displays the home and away team names, score, date, and competition.
-    """
-    def __init__(self, home_team_name, away_team_name, home_score, away_score, date, comp_name):
-        super().__init__()
-        self.setObjectName("leagueCard")
-
-        layout = QVBoxLayout()
-        layout.setAlignment(Qt.AlignCenter)
-
-        info_row = QHBoxLayout()
-        info_row.setAlignment(Qt.AlignCenter)
-        comp_label = QLabel(comp_name)
-        comp_label.setAlignment(Qt.AlignCenter)
-        date_label = QLabel(date)
-        date_label.setAlignment(Qt.AlignCenter)
-
-        info_row.addWidget(comp_label)
-        info_row.addWidget(date_label)
-        layout.addLayout(info_row)
-
-        teams_row = QHBoxLayout()
-        teams_row.setAlignment(Qt.AlignCenter)
-        home_label = QLabel(home_team_name)
-        score_label = QLabel(f"{home_score} : {away_score}")
-        away_label = QLabel(away_team_name)
-        teams_row.addWidget(home_label)
-        teams_row.addWidget(score_label)
-        teams_row.addWidget(away_label)
-        layout.addLayout(teams_row)
-
-        self.setLayout(layout)
-        self.setAttribute(Qt.WA_StyledBackground, True)
+from PyQt5.QtCore import pyqtSignal, Qt, QThreadPool
+from PyQt5.QtGui import QPixmap, QImage, QStandardItemModel, QStandardItem
+from View.Components.PixmapLoader import PixmapDecodeTask
+from View.Prediction.H2HFilter import top_k_recent_indices
 
 
 class MatchCard(QWidget):
@@ -64,13 +27,10 @@ class MatchCard(QWidget):
         super().__init__()
         self.setObjectName("leagueCard")
 
-        self.home_team_name = home_team_name
-        self.away_team_name = away_team_name
-        self.home_team_image = home_team_image
-        self.away_team_image = away_team_image
+        # Only the ids needed by the Predict signal are kept on the
+        # instance; names, date and especially the raw emblem bytes are
+        # consumed here and must not stay alive per card.
         self.code = code
-        self.date = date
-        self.comp_name = comp_name
         self.home_id = home_id
         self.away_id = away_id
 
@@ -78,7 +38,7 @@ class MatchCard(QWidget):
         master.setAlignment(Qt.AlignCenter)
         master.setSpacing(10)
 
-        info = QLabel(f"{self.comp_name} • {self.date}")
+        info = QLabel(f"{comp_name} • {date}")
         info.setAlignment(Qt.AlignCenter)
         master.addWidget(info)
 
@@ -87,28 +47,32 @@ class MatchCard(QWidget):
         home_col = QVBoxLayout()
         away_col = QVBoxLayout()
 
-        home_img = QLabel()
-        pix = QPixmap()
-        pix.loadFromData(self.home_team_image)
-        home_img.setPixmap(pix.scaled(160, 160, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-        home_img.setAlignment(Qt.AlignCenter)
-        home_label = QLabel(self.home_team_name)
+        # Emblems are decoded + scaled on the thread pool so building a
+        # grid of cards does not stall the event loop.
+        self._home_img = QLabel()
+        self._home_img.setAlignment(Qt.AlignCenter)
+        home_label = QLabel(home_team_name)
         home_label.setAlignment(Qt.AlignCenter)
         home_col.addWidget(QLabel("HOME"), alignment=Qt.AlignCenter)
-        home_col.addWidget(home_img)
+        home_col.addWidget(self._home_img)
         home_col.addWidget(home_label)
 
-        away_img = QLabel()
-        pix = QPixmap()
-        pix.loadFromData(self.away_team_image)
-        away_img.setPixmap(pix.scaled(160, 160, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-        away_img.setAlignment(Qt.AlignCenter)
-        away_label = QLabel(self.away_team_name)
+        self._away_img = QLabel()
+        self._away_img.setAlignment(Qt.AlignCenter)
+        away_label = QLabel(away_team_name)
         away_label.setAlignment(Qt.AlignCenter)
         away_col.addWidget(QLabel("AWAY"), alignment=Qt.AlignCenter)
-        away_col.addWidget(away_img)
+        away_col.addWidget(self._away_img)
         away_col.addWidget(away_label)
 
+        pool = QThreadPool.globalInstance()
+        home_task = PixmapDecodeTask(home_team_image, 160, 160)
+        home_task.signals.finished.connect(self.__set_home_emblem)
+        pool.start(home_task)
+        away_task = PixmapDecodeTask(away_team_image, 160, 160)
+        away_task.signals.finished.connect(self.__set_away_emblem)
+        pool.start(away_task)
+
         vs_label = QLabel("VS")
         vs_label.setAlignment(Qt.AlignCenter)
 
@@ -125,6 +89,12 @@ class MatchCard(QWidget):
         self.setLayout(master)
         self.setAttribute(Qt.WA_StyledBackground, True)
 
+    def __set_home_emblem(self, img: QImage) -> None:
+        self._home_img.setPixmap(QPixmap.fromImage(img))
+
+    def __set_away_emblem(self, img: QImage) -> None:
+        self._away_img.setPixmap(QPixmap.fromImage(img))
+
 
 class MatchView(QWidget):
     """
@@ -139,24 +109,30 @@ class MatchView(QWidget):
         back_to_home: Navigate back to home screen.
         back_to_league_hub: Navigate back to league hub.
         back_to_team_hub: Navigate back to team hub.
-        predict_match(int, int, int, list): Emit selected match and chosen ML models.
+        predict_match(int, int, int, int): Emit selected match and the chosen ML
+            models packed as an int bitmask (bit i set = model i selected).
         no_model_selected: Emitted when prediction attempted without selecting any ML models.
     """
     back_to_match_hub = pyqtSignal()
     back_to_home = pyqtSignal()
     back_to_league_hub = pyqtSignal()
     back_to_team_hub = pyqtSignal()
-    predict_match = pyqtSignal(int, int, int, list)
+    predict_match = pyqtSignal(int, int, int, int)
     no_model_selected = pyqtSignal()
 
     def __init__(self):
         super().__init__()
 
+        # Scopes this view's rules in the application-wide stylesheet.
+        self.setObjectName("MatchViewPage")
         self.setWindowTitle("xGoalPro - Match Prediction")
 
         self.matches = []
         self.h2h_matches = []
         self.model_checkboxes = {}
+        self._checkbox_list = []
+        self._last_models_key = None
+        self._pending_h2h = None
 
         self.tab_widget = QTabWidget()
         self.tab_widget.setObjectName("matchTabWidget")
@@ -164,55 +140,91 @@ class MatchView(QWidget):
         self.prediction_tab = QWidget()
         self.h2h_tab = QWidget()
 
-        self.h2h_scroll = QScrollArea()
-        self.h2h_scroll.setWidgetResizable(True)
-
         self.__init_ui()
 
     def refresh_view(self, match_data, h2h_data, ml_models) -> None:
         self._clear_layout(self.prediction_grid)
-        self._clear_layout(self.checkbox_container)
         self._clear_layout(self.result_container)
 
-        # --- Model selection label ---
-        label = QLabel("Choose models for prediction (voting system – averages model outputs)\nHover over a checkbox for more information.")
-        label.setObjectName("checkboxLabel")
-        label.setAlignment(Qt.AlignCenter)
-        self.checkbox_container.addWidget(label)
+        # --- Model checkboxes ---
+        # Rebuilding identical QCheckBox widgets on every match-hub entry is
+        # wasted work; only rebuild when the set of models actually changed.
+        cur_key = tuple(ml_models.keys())
+        if cur_key == self._last_models_key:
+            for cb in self._checkbox_list:
+                cb.setChecked(False)
+        else:
+            self._clear_layout(self.checkbox_container)
 
-        # --- Add checkboxes ---
-        for key, (paths, description) in ml_models.items():
-            cb = QCheckBox(key)
-            cb.setObjectName("modelCheckbox")
-            cb.setChecked(False)
-            cb.setToolTip(description)
-            self.model_checkboxes[key] = cb
-            self.checkbox_container.addWidget(cb)
+            label = QLabel("Choose models for prediction (voting system – averages model outputs)\nHover over a checkbox for more information.")
+            label.setObjectName("checkboxLabel")
+            label.setAlignment(Qt.AlignCenter)
+            self.checkbox_container.addWidget(label)
+
+            self.model_checkboxes = {}
+            self._checkbox_list = []
+            for key, (paths, description) in ml_models.items():
+                cb = QCheckBox(key)
+                cb.setObjectName("modelCheckbox")
+                cb.setChecked(False)
+                cb.setToolTip(description)
+                self.model_checkboxes[key] = cb
+                self._checkbox_list.append(cb)
+                self.checkbox_container.addWidget(cb)
+            self._last_models_key = cur_key
 
         # --- Match cards ---
         cols = 3
         for i, m in enumerate(match_data):
-            date = m['date'].split("T")[0]
+            # ISO-8601 dates are fixed-width, so slicing beats .split("T")
+            date = m['date'][:10]
             card = MatchCard(
                 m['home_name'], m['home_emblem'],
                 m['away_name'], m['away_emblem'],
                 m['id'], date, m['competition'],
                 m['home_id'], m['away_id']
             )
-            card.predict_match.connect(
-                lambda home_id, away_id, match_id: self.__on_predict(home_id, away_id, match_id)
-            )
+            # Bound-method connection: the signal already carries the ids,
+            # so a per-card lambda would be pure overhead.
+            card.predict_match.connect(self.__on_predict)
             self.prediction_grid.addWidget(card, i // cols, i % cols)
 
         # --- H2H tab ---
-        self._clear_layout(self.h2h_v_layout)
-        for h2h in h2h_data:
-            card = MatchH2HCard(
-                h2h['homeTeam'], h2h['awayTeam'],
-                h2h['homeScore'], h2h['awayScore'],
-                h2h['date'].split("T")[0], h2h['competition']
-            )
-            self.h2h_v_layout.addWidget(card)
+        # Defer building the H2H cards until the tab is actually shown;
+        # staying on the Predictions tab is the common case.
+        self._pending_h2h = h2h_data
+        if self.tab_widget.currentIndex() == 1:
+            self.__build_h2h()
+
+    def __build_h2h(self) -> None:
+        """Fill the H2H table model from the pending data, newest first.
+
+        A single QTableView renders only its visible rows, so this replaces
+        N card widgets (labels + layouts each) with plain model items.
+        """
+        h2h_data = self._pending_h2h
+        self._pending_h2h = None
+
+        # Pick the most recent matches with numpy instead of looping over
+        # dicts, then only fill rows for that subset.
+        self.h2h_model.setRowCount(0)
+        dates = [h2h['date'] for h2h in h2h_data]
+        for i in top_k_recent_indices(dates):
+            h2h = h2h_data[i]
+            row = [
+                QStandardItem(h2h['competition']),
+                QStandardItem(h2h['date'][:10]),
+                QStandardItem(h2h['homeTeam']),
+                QStandardItem(f"{h2h['homeScore']} : {h2h['awayScore']}"),
+                QStandardItem(h2h['awayTeam']),
+            ]
+            for item in row:
+                item.setTextAlignment(Qt.AlignCenter)
+            self.h2h_model.appendRow(row)
+
+    def __on_tab_changed(self, idx: int) -> None:
+        if idx == 1 and self._pending_h2h is not None:
+            self.__build_h2h()
 
     def refresh_result(self, data: dict) -> None:
         """Display prediction results inside the styled result container."""
@@ -302,27 +314,31 @@ class MatchView(QWidget):
         self.prediction_tab.setLayout(pred_layout)
 
         # --- H2H Tab ---
-        h2h_container = QWidget()
-        self.h2h_v_layout = QVBoxLayout(h2h_container)
-        self.h2h_scroll.setWidget(h2h_container)
+        self.h2h_model = QStandardItemModel(0, 5)
+        self.h2h_model.setHorizontalHeaderLabels(
+            ["Competition", "Date", "Home", "Score", "Away"])
+        self.h2h_table = QTableView()
+        self.h2h_table.setObjectName("h2hTable")
+        self.h2h_table.setModel(self.h2h_model)
+        self.h2h_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.h2h_table.setSelectionMode(QAbstractItemView.NoSelection)
+        self.h2h_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.h2h_table.verticalHeader().setVisible(False)
         h2h_layout = QVBoxLayout()
-        h2h_layout.addWidget(self.h2h_scroll)
+        h2h_layout.addWidget(self.h2h_table)
         self.h2h_tab.setLayout(h2h_layout)
 
         # --- Tabs ---
         self.tab_widget.addTab(self.prediction_tab, "Predictions")
         self.tab_widget.addTab(self.h2h_tab, "Head 2 Head")
+        self.tab_widget.currentChanged.connect(self.__on_tab_changed)
 
         main_layout.addLayout(top_bar)
         main_layout.addWidget(self.title)
         main_layout.addWidget(self.tab_widget)
         self.setLayout(main_layout)
 
-        # Apply style
-        qss_path = resource_path("./qss/prediction_match_view.qss")
-        if os.path.exists(qss_path):
-            with open(qss_path, "r") as f:
-                self.setStyleSheet(f.read())
+        # Styling comes from the application-wide stylesheet (see main.py).
 
     def _clear_layout(self, layout):
         while layout.count():
@@ -331,8 +347,12 @@ class MatchView(QWidget):
                 item.widget().setParent(None)
 
     def __on_predict(self, home_id, away_id, match_id):
-        code = [1 if cb.isChecked() else 0 for cb in self.model_checkboxes.values()]
-        if sum(code):
-            self.predict_match.emit(home_id, away_id, match_id, code)
+        # Pack the vote into a single int bitmask instead of a per-click list.
+        mask = 0
+        for i, cb in enumerate(self._checkbox_list):
+            if cb.isChecked():
+                mask |= (1 << i)
+        if mask:
+            self.predict_match.emit(home_id, away_id, match_id, mask)
         else:
             self.no_model_selected.emit()
@@ -1,20 +1,20 @@
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QScrollArea, QGridLayout, QSizePolicy
+    QScrollArea, QGridLayout, QSizePolicy, QStyle, QStyleOption
 )
-from PyQt5.QtCore import pyqtSignal, Qt
-from PyQt5.QtGui import QPixmap
-import os
-from ResourcePath import resource_path
+from PyQt5.QtCore import pyqtSignal, Qt, QSize, QRect, QThreadPool
+from PyQt5.QtGui import QPixmap, QImage, QPainter, QColor
+from View.Components.PixmapLoader import PixmapDecodeTask
 
 
-class TeamCard(QWidget):
+class FastTeamCard(QWidget):
     """
     Widget representing a single team card in the TeamHub.
 
-    Displays the team emblem, name, and a "View" button to emit
-    a signal with the team's unique ID.
-    
+    Paints the team emblem and name directly in paintEvent instead of
+    nesting QLabels in a layout, so each card owns just one child widget
+    (the "View" button) instead of four QObjects.
+
     Signals:
         view_team(int): Emitted when the "View" button is clicked, carrying
                         the team's ID.
@@ -27,39 +27,55 @@ class TeamCard(QWidget):
         self.setObjectName("leagueCard")  # reuse same style block
 
         self.name: str = name
-        self.image: bytes = image
         self.code: int = code
 
-        # === Layout ===
-        self.master_layout: QVBoxLayout = QVBoxLayout()
-        self.master_layout.setAlignment(Qt.AlignCenter)
-        self.master_layout.setSpacing(10)
-
-        # === Team image ===
-        self.img: QLabel = QLabel()
-        pixmap = QPixmap()
-        pixmap.loadFromData(self.image)
-        scaled_pixmap = pixmap.scaled(150, 150, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self.img.setPixmap(scaled_pixmap)
-        self.img.setAlignment(Qt.AlignCenter)
-
-        # === Team name ===
-        self.name_label: QLabel = QLabel(f"{self.name}")
-        self.name_label.setAlignment(Qt.AlignCenter)
-
-        # === View button ===
-        self.btn = QPushButton(f"View {self.name}")
+        # The emblem is decoded + scaled on the thread pool; the card
+        # paints without it until the worker delivers.
+        self._pix: QPixmap = QPixmap()
+        task = PixmapDecodeTask(image, 150, 150)
+        task.signals.finished.connect(self.__set_emblem)
+        QThreadPool.globalInstance().start(task)
+
+        # The button is the only child widget; clicks still need one.
+        self.btn = QPushButton(f"View {self.name}", self)
         self.btn.setObjectName("leagueCardButton")
-        self.btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.btn.clicked.connect(lambda: self.view_team.emit(self.code))
 
-        # === Assemble ===
-        self.master_layout.addWidget(self.img)
-        self.master_layout.addWidget(self.name_label)
-        self.master_layout.addWidget(self.btn)
-        self.setLayout(self.master_layout)
         self.setAttribute(Qt.WA_StyledBackground, True)
 
+    def __set_emblem(self, img: QImage) -> None:
+        self._pix = QPixmap.fromImage(img)
+        self.update()
+
+    def sizeHint(self) -> QSize:
+        return QSize(180, 230)
+
+    def resizeEvent(self, event) -> None:
+        btn_h = self.btn.sizeHint().height()
+        self.btn.setGeometry(10, self.height() - btn_h - 10, self.width() - 20, btn_h)
+        super().resizeEvent(event)
+
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self)
+
+        # Draw the QSS background/border the same way QWidget would.
+        opt = QStyleOption()
+        opt.initFrom(self)
+        self.style().drawPrimitive(QStyle.PE_Widget, opt, painter, self)
+
+        if not self._pix.isNull():
+            painter.drawPixmap((self.width() - self._pix.width()) // 2, 10, self._pix)
+        # The removed QLabel was styled by "#leagueCard QLabel" (white,
+        # bold, 16px); the default palette pen would paint black on the
+        # dark card, so set pen and font explicitly.
+        painter.setPen(QColor("#ffffff"))
+        font = painter.font()
+        font.setBold(True)
+        font.setPixelSize(16)
+        painter.setFont(font)
+        text_rect = QRect(0, 10 + self._pix.height(), self.width(), 30)
+        painter.drawText(text_rect, Qt.AlignCenter, self.name)
+
 
 class TeamHubView(QWidget):
     """
@@ -81,7 +97,10 @@ class TeamHubView(QWidget):
     def __init__(self):
         super().__init__()
 
-        self.setObjectName("LeagueHubPage")
+        # Own objectName (was "LeagueHubPage"): this view's rules live in
+        # the application-wide stylesheet, so sharing LeagueHubView's id
+        # would leak them across views.
+        self.setObjectName("TeamHubPage")
         self.setWindowTitle("xGoalPro - TeamHub")
 
         self.master_layout: QVBoxLayout = QVBoxLayout()
@@ -123,11 +142,7 @@ class TeamHubView(QWidget):
         self.master_layout.addWidget(self.scroll)
         self.setLayout(self.master_layout)
 
-        # === Apply shared QSS styling ===
-        qss_path = resource_path("./qss/team_hub_view.qss")
-        if os.path.exists(qss_path):
-            with open(qss_path, "r") as f:
-                self.setStyleSheet(f.read())
+        # Styling comes from the application-wide stylesheet (see main.py).
 
     def refresh_view(self, team_data) -> None:
         """Refresh grid with updated team data."""
@@ -142,6 +157,6 @@ class TeamHubView(QWidget):
         # Add new team cards
         columns = 5
         for i, team in enumerate(team_data[0]):
-            card = TeamCard(team['name'], team['emblem'], team['id'])
-            card.view_team.connect(lambda code: self.show_team.emit(code))
+            card = FastTeamCard(team['name'], team['emblem'], team['id'])
+            card.view_team.connect(self.show_team)  # signal-to-signal, forwarded in C++
             self.grid.addWidget(card, i // columns, i % columns)
@@ -1,6 +1,6 @@
 from PyQt5.QtWidgets import QWidget, QPushButton, QLabel, QVBoxLayout, QHBoxLayout
 from PyQt5.QtCore import pyqtSignal, Qt
-from PyQt5.QtGui import QPixmap
+from PyQt5.QtGui import QPixmap, QPixmapCache
 import os
 from ResourcePath import resource_path
 
@@ -28,7 +28,7 @@ class StatisticsIndexView(QWidget):
         self.setWindowTitle("xGoalPro - Statistics")
 
         self.__init_ui()
-        self.__load_stylesheet()
+        # Styling comes from the application-wide stylesheet (see main.py).
 
     def __init_ui(self):
         # === Root layout ===
@@ -63,7 +63,13 @@ class StatisticsIndexView(QWidget):
         logo_label = QLabel()
         logo_path = resource_path("./Assets/team-stats.jpg")
         if os.path.exists(logo_path):
-            pixmap = QPixmap(logo_path).scaled(360, 360, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            # Cache the decoded + scaled logo so revisiting the dashboard
+            # skips the JPEG decode and smooth-scale.
+            cache_key = "stats_logo_360"
+            pixmap = QPixmapCache.find(cache_key)
+            if pixmap is None:
+                pixmap = QPixmap(logo_path).scaled(360, 360, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                QPixmapCache.insert(cache_key, pixmap)
             logo_label.setPixmap(pixmap)
         else:
             logo_label.setText("xGoalPro")
@@ -89,9 +95,3 @@ class StatisticsIndexView(QWidget):
         btn_layout.addWidget(pred_btn, alignment=Qt.AlignCenter)
 
         root_layout.addLayout(btn_layout)
-
-    def __load_stylesheet(self):
-        qss_path = resource_path("./qss/statistics_index.qss")
-        if os.path.exists(qss_path):
-            with open(qss_path, "r") as f:
-                self.setStyleSheet(f.read())
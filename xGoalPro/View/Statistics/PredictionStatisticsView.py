@@ -1,15 +1,109 @@
+import io
+
 import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTabWidget,
-    QTableWidget, QTableWidgetItem, QHeaderView,
+    QTableView, QAbstractItemView, QHeaderView,
     QLabel, QScrollArea, QSizePolicy, QPushButton,
     QFrame, QSpacerItem
 )
-from PyQt5.QtCore import pyqtSignal, Qt
+from PyQt5.QtCore import (
+    pyqtSignal, Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+)
+from PyQt5.QtGui import QPixmap
+import numpy as np
 import pandas as pd
-import os
-from ResourcePath import resource_path
+from ResourcePath import load_qss
+
+
+def _multi_hist(arrays, lo: float, hi: float, nbins: int = 15) -> np.ndarray:
+    """Histogram several same-range series in one vectorized pass.
+
+    All series are concatenated and binned with a single bincount call, so
+    the data is only walked once instead of once per ax.hist invocation.
+
+    Args:
+        arrays: Sequence of 1-D numpy arrays sharing the [lo, hi] range.
+        lo (float): Lower bound of the binning range.
+        hi (float): Upper bound of the binning range.
+        nbins (int): Number of equal-width bins.
+
+    Returns:
+        np.ndarray: counts of shape (len(arrays), nbins).
+    """
+    data = np.concatenate(arrays)
+    series = np.repeat(np.arange(len(arrays)), [len(a) for a in arrays])
+    span = (hi - lo) or 1.0
+    idx = ((data - lo) * (nbins / span)).astype(np.intp).clip(0, nbins - 1)
+    counts = np.bincount(series * nbins + idx, minlength=len(arrays) * nbins)
+    return counts.reshape(len(arrays), nbins)
+
+
+class PredictionTableModel(QAbstractTableModel):
+    """
+    Read-only table model over the prediction DataFrame.
+
+    All cell text is preformatted in bulk with vectorized np.char calls,
+    so data() is a plain array index and no QTableWidgetItem objects are
+    allocated.
+    """
+
+    HEADERS = [
+        "Match", "Model", "Home xG", "Away xG",
+        "Home Win %", "Draw %", "Away Win %", "Result"
+    ]
+    MODEL_LEGEND = ("First model - XGB\nSecond model - MLP\n"
+                    "Third model - GradientBoost\nFourth model - SVR")
+
+    def __init__(self, df: pd.DataFrame, parent=None):
+        super().__init__(parent)
+        # Every display column is formatted up front with one vectorized
+        # np.char pass; data() then only indexes ready-made strings.
+        home_name = df["home_name"].to_numpy(dtype=str)
+        away_name = df["away_name"].to_numpy(dtype=str)
+        match = np.char.add(np.char.add(home_name, " vs "), away_name)
+
+        home_p = np.char.add(np.char.mod("%.1f", df["home_p"].to_numpy() * 100), "%")
+        draw_p = np.char.add(np.char.mod("%.1f", df["draw_p"].to_numpy() * 100), "%")
+        away_p = np.char.add(np.char.mod("%.1f", df["away_p"].to_numpy() * 100), "%")
+
+        rh = df["real_home_score"].to_numpy()
+        ra = df["real_away_score"].to_numpy()
+        score = np.char.add(np.char.add(np.char.mod("%d", rh.astype(int)), " - "),
+                            np.char.mod("%d", ra.astype(int)))
+        result = np.where((rh == -1) | (ra == -1), "⏳ Yet to play", score)
+
+        self._columns = [
+            match,
+            df["model"].to_numpy(dtype=str),
+            np.char.mod("%.2f", df["home_xg"].to_numpy()),
+            np.char.mod("%.2f", df["away_xg"].to_numpy()),
+            home_p,
+            draw_p,
+            away_p,
+            result,
+        ]
+        self._rows = len(df)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._rows
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ToolTipRole and index.column() == 1:
+            return self.MODEL_LEGEND
+        if role not in (Qt.DisplayRole, Qt.ToolTipRole):
+            return None
+        return str(self._columns[index.column()][index.row()])
 
 
 class PredictionStatisticsView(QWidget):
@@ -31,7 +125,7 @@ class PredictionStatisticsView(QWidget):
 
     Internally:
         __generate_figures(df): Generates matplotlib figures for charts.
-        __create_match_table(df): Builds a QTableWidget from prediction DataFrame.
+        __create_match_table(df): Builds a QTableView over the prediction DataFrame.
         __load_stylesheet(): Loads the QSS stylesheet for consistent UI styling.
     """
     back_to_home: pyqtSignal = pyqtSignal()
@@ -111,31 +205,28 @@ class PredictionStatisticsView(QWidget):
 
         self.table = None
         self.canvas_widgets = []
+        self._pending_df = None
+        self._last_sig = None
+        self.tabs.currentChanged.connect(self.__on_tab_changed)
 
         self.__load_stylesheet()
 
     # === Public Methods ===
     def clear_layout(self):
-        """Completely clear old charts and table from the view."""
-        # --- Remove all canvases (matplotlib) ---
-        for w in self.canvas_widgets:
-            w.setParent(None)
-            w.deleteLater()
-        self.canvas_widgets.clear()
-
-        # --- Fully clear the scroll layout (chart area) ---
-        def clear_layout_items(layout):
-            if layout is not None:
-                while layout.count():
-                    item = layout.takeAt(0)
-                    widget = item.widget()
-                    child_layout = item.layout()
-                    if widget is not None:
-                        widget.deleteLater()
-                    elif child_layout is not None:
-                        clear_layout_items(child_layout)
+        """Completely clear old charts and table from the view.
 
-        clear_layout_items(self.scroll_layout)
+        Instead of recursively walking the chart layout, the whole charts
+        container is swapped for a fresh QWidget and the old one handed to
+        deleteLater(); Qt tears down the subtree in C++ in one go.
+        """
+        old_container = self.scroll_area.takeWidget()
+        self.charts_container = QWidget()
+        self.charts_container.setObjectName("chartsContainer")
+        self.scroll_layout = QHBoxLayout(self.charts_container)
+        self.scroll_layout.setAlignment(Qt.AlignTop)
+        self.scroll_area.setWidget(self.charts_container)
+        old_container.deleteLater()
+        self.canvas_widgets.clear()
 
         # --- Clear the table tab content ---
         if self.table:
@@ -143,7 +234,32 @@ class PredictionStatisticsView(QWidget):
             self.table.deleteLater()
             self.table = None
 
+        self._pending_df = None
+        self._last_sig = None
+
     def refresh_view(self, data_list):
+        # Re-navigating to the view with the same predictions is a no-op:
+        # a content signature is compared before any teardown happens.
+        sig = (len(data_list),
+               hash(tuple((d.get("home_name"), d.get("away_name"), d.get("model"),
+                           d.get("real_home_score"), d.get("real_away_score"))
+                          for d in data_list)))
+        if sig == self._last_sig and self.table is not None:
+            return
+
+        # Suppress repaints while charts and table are swapped in; Qt would
+        # otherwise schedule a paint/layout pass per insertion.
+        self.setUpdatesEnabled(False)
+        self.scroll_area.viewport().setUpdatesEnabled(False)
+        try:
+            self.__refresh_view(data_list)
+            self._last_sig = sig  # after clear_layout() has reset it
+        finally:
+            self.scroll_area.viewport().setUpdatesEnabled(True)
+            self.setUpdatesEnabled(True)
+            self.update()
+
+    def __refresh_view(self, data_list):
         self.clear_layout()
 
         if not data_list:
@@ -151,6 +267,19 @@ class PredictionStatisticsView(QWidget):
             return
 
         df = pd.DataFrame(data_list)
+
+        # The table is the cheap path and is always built; the matplotlib
+        # dashboard figure waits until the Plots tab is actually shown.
+        self.table = self.__create_match_table(df)
+        self.table_layout.addWidget(self.table)
+
+        self._pending_df = df
+        if self.tabs.currentWidget() is self.charts_tab:
+            self.__build_charts()
+
+    def __build_charts(self):
+        df = self._pending_df
+        self._pending_df = None
         figures = self.__generate_figures(df)
 
         # Place charts in two columns
@@ -159,15 +288,25 @@ class PredictionStatisticsView(QWidget):
         right_col = QVBoxLayout()
 
         for i, (fig, desc) in enumerate(figures):
-            canvas = FigureCanvas(fig)
-            canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-            canvas.setMinimumHeight(400)
+            # Rasterize once to a pixmap instead of embedding a live Agg
+            # canvas; a QLabel costs nothing to repaint while scrolling.
+            buf = io.BytesIO()
+            fig.savefig(buf, format="png", dpi=100, bbox_inches="tight")
+            plt.close(fig)
+            pix = QPixmap()
+            pix.loadFromData(buf.getvalue())
+
+            chart = QLabel()
+            chart.setPixmap(pix)
+            chart.setScaledContents(True)
+            chart.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+            chart.setMinimumHeight(400)
 
             frame = QFrame()
             frame.setObjectName("chartFrame")
             frame_layout = QVBoxLayout(frame)
             frame_layout.setContentsMargins(12, 12, 12, 12)
-            frame_layout.addWidget(canvas)
+            frame_layout.addWidget(chart)
 
             # Description label under each chart
             desc_label = QLabel(desc)
@@ -181,136 +320,136 @@ class PredictionStatisticsView(QWidget):
             else:
                 right_col.addWidget(frame)
 
-            self.canvas_widgets.append(canvas)
+            self.canvas_widgets.append(chart)
 
         col_layout.addLayout(left_col)
         col_layout.addLayout(right_col)
         self.scroll_layout.addLayout(col_layout)
 
-        # Create match table
-        self.table = self.__create_match_table(df)
-        self.table_layout.addWidget(self.table)
+    def __on_tab_changed(self, idx: int) -> None:
+        if self.tabs.widget(idx) is self.charts_tab and self._pending_df is not None:
+            self.__build_charts()
 
     # === Internal Methods ===
     @staticmethod
     def __generate_figures(df: pd.DataFrame) -> list:
-        figs = []
+        # Categorical model column: both groupbys below then hash int8
+        # codes instead of strings. observed=True keeps models with no
+        # rows out of the plots, sort=False skips the final sort. The
+        # categories come from the data itself — the column holds the
+        # model bit-code strings (see MODEL_LEGEND), not display names.
+        df = df.copy()
+        df["model"] = pd.Categorical(df["model"])
+
+        # One figure with a 2x2 grid instead of four independent figures:
+        # a single Agg backend/renderer is set up and tight_layout runs
+        # once over all four axes (on separate figures it only ever acted
+        # on the current one).
+        fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+        ax1, ax2, ax3, ax4 = axes.flat
 
         # --- xG Distribution ---
-        fig1, ax1 = plt.subplots()
-        ax1.hist(df["home_xg"], bins=15, alpha=0.6, label="Home xG")
-        ax1.hist(df["away_xg"], bins=15, alpha=0.6, label="Away xG")
+        # Bin counts are computed in one numpy pass and fed to ax.bar;
+        # ax.hist would re-bin each series separately.
+        home_xg = df["home_xg"].to_numpy()
+        away_xg = df["away_xg"].to_numpy()
+        xg_lo = min(home_xg.min(), away_xg.min())
+        xg_hi = max(home_xg.max(), away_xg.max())
+        xg_counts = _multi_hist((home_xg, away_xg), xg_lo, xg_hi)
+        xg_edges = np.linspace(xg_lo, xg_hi, 16)
+        xg_width = (xg_hi - xg_lo) / 15 or 1.0
+        ax1.bar(xg_edges[:-1], xg_counts[0], width=xg_width, align="edge",
+                alpha=0.6, label="Home xG")
+        ax1.bar(xg_edges[:-1], xg_counts[1], width=xg_width, align="edge",
+                alpha=0.6, label="Away xG")
         ax1.set_title("Distribution of Expected Goals")
         ax1.set_xlabel("xG")
         ax1.set_ylabel("Count")
         ax1.legend()
-        figs.append((fig1, "Shows how expected goals (xG) are distributed across matches for home and away teams."))
 
         # --- Accuracy per Model ---
-        valid_df = df[(df["real_home_score"] >= 0) & (df["real_away_score"] >= 0)].copy()
-        if not valid_df.empty:
-            def predicted_result(row):
-                probs = {"Home": row["home_p"], "Draw": row["draw_p"], "Away": row["away_p"]}
-                return max(probs, key=probs.get)
-
-            def actual_result(row):
-                if row["real_home_score"] > row["real_away_score"]:
-                    return "Home"
-                elif row["real_home_score"] < row["real_away_score"]:
-                    return "Away"
-                else:
-                    return "Draw"
-
-            valid_df["predicted"] = valid_df.apply(predicted_result, axis=1)
-            valid_df["actual"] = valid_df.apply(actual_result, axis=1)
-            valid_df["correct"] = valid_df["predicted"] == valid_df["actual"]
-
-            accuracy = valid_df.groupby("model")["correct"].mean() * 100
-
-            fig2, ax2 = plt.subplots()
+        # Completed matches are selected with a boolean mask over raw
+        # numpy views; no valid_df copy (and none of its indexes) is ever
+        # materialized.
+        rh = df["real_home_score"].to_numpy()
+        ra = df["real_away_score"].to_numpy()
+        mask = (rh >= 0) & (ra >= 0)
+        if mask.any():
+            # Vectorized outcome computation: argmax over the stacked
+            # probability columns and np.where on the scores, instead of a
+            # Python-level apply per row. Outcomes are compared as integer
+            # codes (0=Home, 1=Draw, 2=Away).
+            stacked = np.stack([
+                df["home_p"].to_numpy()[mask],
+                df["draw_p"].to_numpy()[mask],
+                df["away_p"].to_numpy()[mask]
+            ], axis=1)
+            predicted = stacked.argmax(axis=1)
+
+            rh_m = rh[mask]
+            ra_m = ra[mask]
+            actual = np.where(rh_m > ra_m, 0, np.where(rh_m < ra_m, 2, 1))
+            correct = predicted == actual
+
+            # One throwaway Series just for the aggregation, grouped by
+            # the (already categorical) masked model column.
+            accuracy = pd.Series(correct).groupby(
+                df["model"].values[mask], sort=False, observed=True).mean() * 100
+
             accuracy.plot(kind="bar", ax=ax2)
             ax2.set_title("Prediction Accuracy by Model")
             ax2.set_ylabel("Accuracy (%)")
             ax2.set_ylim(0, 100)
             for i, v in enumerate(accuracy):
                 ax2.text(i, v + 1, f"{v:.1f}%", ha='center')
-            figs.append((fig2, "Compares how accurate each prediction model was based on actual match outcomes."))
         else:
-            fig2, ax2 = plt.subplots()
             ax2.text(0.5, 0.5, "No completed matches available for accuracy evaluation.",
                      ha="center", va="center", fontsize=12)
             ax2.axis("off")
-            figs.append((fig2, "Accuracy data unavailable (no completed matches)."))
 
         # --- Probability Distributions ---
-        fig3, ax3 = plt.subplots()
-        ax3.hist(df["home_p"], bins=15, alpha=0.6, label="Home Win")
-        ax3.hist(df["draw_p"], bins=15, alpha=0.6, label="Draw")
-        ax3.hist(df["away_p"], bins=15, alpha=0.6, label="Away Win")
+        p_counts = _multi_hist((df["home_p"].to_numpy(),
+                                df["draw_p"].to_numpy(),
+                                df["away_p"].to_numpy()), 0.0, 1.0)
+        p_edges = np.linspace(0.0, 1.0, 16)
+        for counts, name in zip(p_counts, ("Home Win", "Draw", "Away Win")):
+            ax3.bar(p_edges[:-1], counts, width=1.0 / 15, align="edge",
+                    alpha=0.6, label=name)
         ax3.set_title("Distribution of Predicted Probabilities")
         ax3.set_xlabel("Probability")
         ax3.set_ylabel("Count")
         ax3.legend()
-        figs.append((fig3, "Displays how prediction probabilities are distributed for home, draw, and away outcomes."))
 
         # --- Average per Model ---
-        fig4, ax4 = plt.subplots()
-        model_avg = df.groupby("model")[["home_xg", "away_xg", "home_p", "draw_p", "away_p"]].mean()
+        model_avg = df.groupby("model", sort=False, observed=True)[
+            ["home_xg", "away_xg", "home_p", "draw_p", "away_p"]].mean()
         model_avg.plot(kind="bar", ax=ax4)
         ax4.set_title("Average Predictions per Model")
         ax4.set_ylabel("Mean Value")
-        figs.append((fig4, "Shows average predicted values (xG and probabilities) for each model."))
 
-        plt.tight_layout(rect=(0, 0, 1, 0.95))
-        return figs
+        fig.tight_layout(rect=(0, 0, 1, 0.98))
+        return [(fig,
+                 "Top left: how expected goals (xG) are distributed across matches for home and away teams. "
+                 "Top right: how accurate each prediction model was based on actual match outcomes. "
+                 "Bottom left: how prediction probabilities are distributed for home, draw, and away outcomes. "
+                 "Bottom right: average predicted values (xG and probabilities) for each model.")]
 
     @staticmethod
-    def __create_match_table(df: pd.DataFrame) -> QTableWidget:
-        table = QTableWidget()
+    def __create_match_table(df: pd.DataFrame) -> QTableView:
+        table = QTableView()
         table.setObjectName("statsTable")
-
-        headers = [
-            "Match", "Model", "Home xG", "Away xG",
-            "Home Win %", "Draw %", "Away Win %", "Result"
-        ]
-        table.setColumnCount(len(headers))
-        table.setHorizontalHeaderLabels(headers)
-        table.setRowCount(len(df))
-
-        for i, row in df.iterrows():
-            match_text = f"{row['home_name']} vs {row['away_name']}"
-            items = [
-                QTableWidgetItem(match_text),
-                QTableWidgetItem(row["model"]),
-                QTableWidgetItem(f"{row['home_xg']:.2f}"),
-                QTableWidgetItem(f"{row['away_xg']:.2f}"),
-                QTableWidgetItem(f"{row['home_p'] * 100:.1f}%"),
-                QTableWidgetItem(f"{row['draw_p'] * 100:.1f}%"),
-                QTableWidgetItem(f"{row['away_p'] * 100:.1f}%")
-            ]
-
-            if row["real_home_score"] == -1 or row["real_away_score"] == -1:
-                result = "⏳ Yet to play"
-            else:
-                result = f"{int(row['real_home_score'])} - {int(row['real_away_score'])}"
-            items.append(QTableWidgetItem(result))
-
-            for col, item in enumerate(items):
-                if col == 1:
-                    item.setToolTip("First model - XGB\nSecond model - MLP\n"
-                                    "Third model - GradientBoost\nFourth model - SVR")
-                else:
-                    item.setToolTip(item.text())
-                table.setItem(i, col, item)
+        # Proxy keeps header-click sorting working on the read-only model.
+        proxy = QSortFilterProxyModel(table)
+        proxy.setSourceModel(PredictionTableModel(df, proxy))
+        table.setModel(proxy)
 
         table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         table.setSortingEnabled(True)
         table.verticalHeader().setVisible(False)
         return table
 
     def __load_stylesheet(self):
-        qss_path = resource_path("./qss/prediction_statistics.qss")
-        if os.path.exists(qss_path):
-            with open(qss_path, "r") as f:
-                self.setStyleSheet(f.read())
+        qss = load_qss("./qss/prediction_statistics.qss")
+        if qss:
+            self.setStyleSheet(qss)
@@ -1,19 +1,22 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QPushButton, QLabel,
                              QScrollArea, QGridLayout, QSizePolicy, QHBoxLayout, QSpacerItem)
-from PyQt5.QtCore import pyqtSignal, Qt
-from PyQt5.QtGui import QPixmap
-import os
-from ResourcePath import resource_path
+from PyQt5.QtCore import pyqtSignal, Qt, QSize, QThreadPool
+from PyQt5.QtGui import QPixmap, QImage, QIcon
+from ResourcePath import load_qss
+from View.Components.PixmapLoader import PixmapDecodeTask
 
 
-class LeagueCard(QWidget):
+class LeagueCard(QPushButton):
     """
-    A card widget representing a single league.
+    A card button representing a single league.
 
-    Displays the league's emblem, short name, and a button to view the league.
+    The whole card is one QPushButton showing the emblem as its icon and
+    the league name as its text — one widget per card instead of a
+    QVBoxLayout nesting an image label, a name label, and a button, which
+    keeps the widget tree shallow when the grid holds dozens of leagues.
 
     Signals:
-        view_league (str): Emitted when the "View" button is clicked, passing the league's long name.
+        view_league (str): Emitted when the card is clicked, passing the league's long name.
 
     Args:
         name (str): Short name of the league.
@@ -23,8 +26,12 @@ class LeagueCard(QWidget):
     """
     view_league: pyqtSignal(str) = pyqtSignal(str)
 
+    # Decoded + scaled emblems shared across cards and refreshes, keyed by
+    # the emblem bytes; QPixmap is refcounted so sharing is safe.
+    _scaled_cache: dict = {}
+
     def __init__(self, name, image, code, long_name):
-        super().__init__()
+        super().__init__(f"{name}\nView")
         self.setObjectName("leagueCard")
 
         self.name: str = name
@@ -32,34 +39,27 @@ class LeagueCard(QWidget):
         self.code: str = code
         self.long_name: str = long_name
 
-        self.master_layout = QVBoxLayout()
-        self.master_layout.setAlignment(Qt.AlignCenter)
-        self.master_layout.setSpacing(10)
-
-        # League image
-        self.img: QLabel = QLabel()
-        pixmap = QPixmap()
-        pixmap.loadFromData(self.image)
-        scaled_pixmap = pixmap.scaled(200, 200, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self.img.setPixmap(scaled_pixmap)
-        self.img.setAlignment(Qt.AlignCenter)
-
-        # League name
-        self.name_label: QLabel = QLabel(f"{self.name}")
-        self.name_label.setAlignment(Qt.AlignCenter)
-
-        # View button
-        self.btn: QPushButton = QPushButton(f"View {self.name}")
-        self.btn.setObjectName("leagueCardButton")
-        self.btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        self.btn.clicked.connect(lambda: self.view_league.emit(self.long_name))
-
-        # Add widgets
-        self.master_layout.addWidget(self.img)
-        self.master_layout.addWidget(self.name_label)
-        self.master_layout.addWidget(self.btn)
-        self.setLayout(self.master_layout)
-        self.setAttribute(Qt.WA_StyledBackground, True)
+        self.setIconSize(QSize(200, 200))
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+        # League emblem: cache hits apply immediately, misses are decoded
+        # and scaled on the thread pool so the card grid builds without
+        # stalling the GUI thread.
+        self._cache_key = hash(bytes(self.image))
+        scaled_pixmap = self._scaled_cache.get(self._cache_key)
+        if scaled_pixmap is not None:
+            self.setIcon(QIcon(scaled_pixmap))
+        else:
+            task = PixmapDecodeTask(self.image, 200, 200, smooth=True)
+            task.signals.finished.connect(self.__set_emblem)
+            QThreadPool.globalInstance().start(task)
+
+        self.clicked.connect(lambda: self.view_league.emit(self.long_name))
+
+    def __set_emblem(self, img: QImage) -> None:
+        pixmap = QPixmap.fromImage(img)
+        self._scaled_cache[self._cache_key] = pixmap
+        self.setIcon(QIcon(pixmap))
 
 
 class StatisticsLeagueHubView(QWidget):
@@ -140,22 +140,30 @@ class StatisticsLeagueHubView(QWidget):
         self.master_layout.addWidget(self.scroll)
         self.setLayout(self.master_layout)
 
-        # Load QSS
-        qss_path = resource_path("./qss/stat_league_hub.qss")
-        if os.path.exists(qss_path):
-            with open(qss_path, "r") as f:
-                self.setStyleSheet(f.read())
+        # Load QSS (cached in memory across instantiations)
+        qss = load_qss("./qss/stat_league_hub.qss")
+        if qss:
+            self.setStyleSheet(qss)
 
     def refresh_view(self, leagues_data) -> None:
-        # Clear previous widgets
-        for i in reversed(range(self.grid.count())):
-            widget = self.grid.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-
-        # Populate grid with new leagues
-        columns = 3
-        for i, league in enumerate(leagues_data):
-            card = LeagueCard(league['name'], league['emblem'], league['code'], league['long_name'])
-            card.view_league.connect(lambda code: self.show_league.emit(code))
-            self.grid.addWidget(card, i // columns, i % columns)
+        # Suppress repaints while the grid is torn down and repopulated;
+        # one final relayout instead of one per card.
+        self.setUpdatesEnabled(False)
+        self.scroll.viewport().setUpdatesEnabled(False)
+        try:
+            # Clear previous widgets
+            for i in reversed(range(self.grid.count())):
+                widget = self.grid.itemAt(i).widget()
+                if widget:
+                    widget.setParent(None)
+
+            # Populate grid with new leagues
+            columns = 3
+            for i, league in enumerate(leagues_data):
+                card = LeagueCard(league['name'], league['emblem'], league['code'], league['long_name'])
+                card.view_league.connect(self.show_league)  # signal-to-signal, no per-card closure
+                self.grid.addWidget(card, i // columns, i % columns)
+        finally:
+            self.scroll.viewport().setUpdatesEnabled(True)
+            self.setUpdatesEnabled(True)
+            self.update()
@@ -1,23 +1,62 @@
-import ast
-import os
-from PyQt5.QtCore import pyqtSignal, Qt
-from PyQt5.QtGui import QPixmap, QIcon
-from PyQt5.QtGui import QColor
+from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtGui import QColor, QBrush, QPalette
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QTabWidget, QPushButton,
-    QHBoxLayout, QTableWidget, QTableWidgetItem, QLabel, QHeaderView
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTableView,
+    QAbstractItemView, QHeaderView, QTabWidget, QPushButton,
+    QStyledItemDelegate
 )
-from ResourcePath import resource_path
+from ResourcePath import load_qss
+from View.Components.StatsTableModel import StatsTableModel, populate_guard
 
-import pandas as pd
+# PTS column colors built once and shared by the delegate.
+_PTS_FG = QColor("#15181E")
+_PTS_BG = QBrush(QColor("#00b87b"))
 
 
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QPixmap, QIcon, QColor
-from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTableWidget, 
-    QTableWidgetItem, QHeaderView, QTabWidget, QPushButton
-)
+class PtsDelegate(QStyledItemDelegate):
+    """
+    Paints the uniform PTS column highlight at draw time.
+
+    The color is per-column, not per-cell, so painting it here spares the
+    model a Foreground/BackgroundRole dispatch for every visible cell.
+    """
+
+    def paint(self, painter, option, index):
+        painter.fillRect(option.rect, _PTS_BG)
+        option.palette.setColor(QPalette.Text, _PTS_FG)
+        super().paint(painter, option, index)
+
+
+class LeagueTableModel(StatsTableModel):
+    """
+    Standings model: the generic dict-backed model configured with the
+    standings columns and the team-emblem icon column. The PTS highlight
+    is painted by PtsDelegate, not served through data().
+    """
+
+    HEADERS = ["Team", "M", "W", "D", "L", "GF", "GA", "PTS"]
+    KEYS = ("name", "playedGames", "won", "draw", "lost",
+            "goalsFor", "goalsAgainst", "points")
+    TOOLTIPS = [
+        "Team name with emblem",
+        "Matches played",
+        "Wins",
+        "Draws",
+        "Losses",
+        "Goals scored",
+        "Goals against",
+        "Points"
+    ]
+
+    def __init__(self, parent=None):
+        # The team emblem goes through the shared icon column: cached
+        # pixmaps show immediately, first-time decodes run on the thread
+        # pool and repaint their cell when done.
+        super().__init__(self.HEADERS, self.KEYS, self.TOOLTIPS,
+                         left_cols=(0,), icon_cols={0: ("id", "emblem")},
+                         int_cols=(1, 2, 3, 4, 5, 6, 7),
+                         parent=parent)
+
 
 class LeagueTableWidget(QWidget):
     """
@@ -41,32 +80,27 @@ class LeagueTableWidget(QWidget):
         layout.addWidget(self.info_label)
 
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(8)
-        self.table.setHorizontalHeaderLabels(
-            ["Team", "M", "W", "D", "L", "GF", "GA", "PTS"]
-        )
-
-        header_tooltips = [
-            "Team name with emblem",
-            "Matches played",
-            "Wins",
-            "Draws",
-            "Losses",
-            "Goals scored",
-            "Goals against",
-            "Points"
-        ]
+        self.table = QTableView()
+        self.model = LeagueTableModel(self)
+        self.table.setModel(self.model)
+        self.table.setItemDelegateForColumn(7, PtsDelegate(self.table))
 
+        # Only the team column stretches; the stat columns size to their
+        # contents once instead of being recomputed on every resize.
         header = self.table.horizontalHeader()
-        for i, tip in enumerate(header_tooltips):
-            header.model().setHeaderData(i, Qt.Horizontal, tip, Qt.ToolTipRole)
-
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.table.verticalHeader().setVisible(False)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.cellClicked.connect(self.__on_cell_clicked)
+        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        vheader = self.table.verticalHeader()
+        vheader.setVisible(False)
+        # Uniform 32px rows: Fixed mode lets Qt skip per-row height
+        # queries during paint and scrolling entirely.
+        vheader.setSectionResizeMode(QHeaderView.Fixed)
+        vheader.setMinimumSectionSize(32)
+        vheader.setDefaultSectionSize(32)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.clicked.connect(self.__on_cell_clicked)
         layout.addWidget(self.table)
 
         self._team_data = []
@@ -78,40 +112,12 @@ class LeagueTableWidget(QWidget):
             'id', 'name', 'emblem' (bytes), 'playedGames', 'won', 'draw',
             'lost', 'goalsFor', 'goalsAgainst', 'points'
         """
-        self.table.setRowCount(len(teams))
         self._team_data = teams
+        with populate_guard(self.table):
+            self.model.update(teams)
 
-        for row_idx, team in enumerate(teams):
-            # Team name + emblem
-            pixmap = QPixmap()
-            pixmap.loadFromData(team["emblem"])
-            icon = QIcon(pixmap.scaled(24, 24, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-            item = QTableWidgetItem(team["name"])
-            item.setIcon(icon)
-            item.setTextAlignment(Qt.AlignVCenter | Qt.AlignLeft)
-            item.setToolTip(team["name"])
-            self.table.setItem(row_idx, 0, item)
-            self.table.setRowHeight(row_idx, 32)
-
-            # Stats columns
-            stats = [
-                team["playedGames"], team["won"], team["draw"], team["lost"],
-                team["goalsFor"], team["goalsAgainst"], team["points"]
-            ]
-            for col_idx, value in enumerate(stats, start=1):
-                stat_item = QTableWidgetItem(str(value))
-                stat_item.setTextAlignment(Qt.AlignCenter)
-
-                # Highlight PTS column (last column)
-                if col_idx == 7:
-                    stat_item.setForeground(QColor("#15181E"))
-                    stat_item.setBackground(QColor("#00b87b"))
-
-                stat_item.setToolTip(str(value))
-                self.table.setItem(row_idx, col_idx, stat_item)
-
-    def __on_cell_clicked(self, row, column):
-        team_id = self._team_data[row]["id"]
+    def __on_cell_clicked(self, index):
+        team_id = self._team_data[index.row()]["id"]
         self.team_clicked.emit(team_id)
         self.table.clearSelection()
 
@@ -131,24 +137,36 @@ class TopScorersWidget(QWidget):
         self.info_label.setObjectName("infoLabel")
         layout.addWidget(self.info_label)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["Player", "Games", "Goals", "Assists", "Team"])
-
-        header_tooltips = [
-            "Player name",
-            "Games played",
-            "Goals scored",
-            "Assists made",
-            "Team name with emblem"
-        ]
-        header = self.table.horizontalHeader()
-        for i, tip in enumerate(header_tooltips):
-            header.model().setHeaderData(i, Qt.Horizontal, tip, Qt.ToolTipRole)
+        self.table = QTableView()
+        self.model = StatsTableModel(
+            ["Player", "Games", "Goals", "Assists", "Team"],
+            ("player_name", "playedMatches", "goals", "assists", "name"),
+            [
+                "Player name",
+                "Games played",
+                "Goals scored",
+                "Assists made",
+                "Team name with emblem"
+            ],
+            icon_cols={4: ("id", "emblem")},
+            int_cols=(1, 2, 3),
+            parent=self
+        )
+        self.table.setModel(self.model)
 
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.table.verticalHeader().setVisible(False)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        header.setSectionResizeMode(4, QHeaderView.Stretch)
+        self.table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        vheader = self.table.verticalHeader()
+        vheader.setVisible(False)
+        # Uniform 32px rows: Fixed mode lets Qt skip per-row height
+        # queries during paint and scrolling entirely.
+        vheader.setSectionResizeMode(QHeaderView.Fixed)
+        vheader.setMinimumSectionSize(32)
+        vheader.setDefaultSectionSize(32)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         layout.addWidget(self.table)
 
     def update_table(self, players) -> None:
@@ -157,29 +175,8 @@ class TopScorersWidget(QWidget):
         players: list of dicts with keys:
             'player_name', 'playedMatches', 'goals', 'assists', 'name' (team), 'emblem' (bytes)
         """
-        players = players[:20]
-        self.table.setRowCount(len(players))
-
-        for row_idx, player in enumerate(players):
-            # Player name
-            item = QTableWidgetItem(player["player_name"])
-            item.setTextAlignment(Qt.AlignCenter)
-            item.setToolTip(player["player_name"])
-            self.table.setItem(row_idx, 0, item)
-
-            # Games, Goals, Assists
-            for col, key in enumerate(["playedMatches", "goals", "assists"], start=1):
-                val_item = QTableWidgetItem(str(player[key]))
-                val_item.setTextAlignment(Qt.AlignCenter)
-                val_item.setToolTip(str(player[key]))
-                self.table.setItem(row_idx, col, val_item)
-
-            # Team name + emblem
-            team_item = QTableWidgetItem(player["name"])
-            team_item.setTextAlignment(Qt.AlignCenter)
-            team_item.setToolTip(player["name"])
-            self.table.setItem(row_idx, 4, team_item)
-            self.table.setRowHeight(row_idx, 32)
+        with populate_guard(self.table):
+            self.model.update(players[:20])
 
 
 class ResultsWidget(QWidget):
@@ -191,12 +188,28 @@ class ResultsWidget(QWidget):
         super().__init__()
         layout = QVBoxLayout(self)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["Home", "Score", "Away", "Date"])
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.table.verticalHeader().setVisible(False)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table = QTableView()
+        self.model = StatsTableModel(
+            ["Home", "Score", "Away", "Date"],
+            ("home_name", "score", "away_name", "date"),
+            icon_cols={0: ("home_name", "home_emblem"),
+                       2: ("away_name", "away_emblem")},
+            parent=self
+        )
+        self.table.setModel(self.model)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        header.setSectionResizeMode(2, QHeaderView.Stretch)
+        self.table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        vheader = self.table.verticalHeader()
+        vheader.setVisible(False)
+        # Uniform 32px rows: Fixed mode lets Qt skip per-row height
+        # queries during paint and scrolling entirely.
+        vheader.setSectionResizeMode(QHeaderView.Fixed)
+        vheader.setMinimumSectionSize(32)
+        vheader.setDefaultSectionSize(32)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         layout.addWidget(self.table)
 
     def update_table(self, results) -> None:
@@ -204,34 +217,8 @@ class ResultsWidget(QWidget):
         results: list of dicts with keys:
             'home_name', 'home_emblem', 'score', 'away_name', 'away_emblem', 'date'
         """
-        self.table.setRowCount(len(results))
-
-        for row_idx, match in enumerate(results):
-            # Home team + emblem
-            home_item = QTableWidgetItem(match["home_name"])
-            home_item.setTextAlignment(Qt.AlignCenter)
-            home_item.setToolTip(match["home_name"])
-            self.table.setItem(row_idx, 0, home_item)
-
-            # Score
-            score_item = QTableWidgetItem(match["score"])
-            score_item.setTextAlignment(Qt.AlignCenter)
-            score_item.setToolTip(match["score"])
-            self.table.setItem(row_idx, 1, score_item)
-
-            # Away team + emblem
-            away_item = QTableWidgetItem(match["away_name"])
-            away_item.setTextAlignment(Qt.AlignCenter)
-            away_item.setToolTip(match["away_name"])
-            self.table.setItem(row_idx, 2, away_item)
-
-            # Date
-            date_item = QTableWidgetItem(match["date"])
-            date_item.setTextAlignment(Qt.AlignCenter)
-            date_item.setToolTip(match["date"])
-            self.table.setItem(row_idx, 3, date_item)
-
-            self.table.setRowHeight(row_idx, 32)
+        with populate_guard(self.table):
+            self.model.update(results)
 
 
 class StatisticsLeagueView(QWidget):
@@ -266,18 +253,25 @@ class StatisticsLeagueView(QWidget):
     def __init__(self):
         super().__init__()
         self.setObjectName("StatisticsLeagueView")
+        self._data = None
+        self._qss_loaded = False
         self.__init_ui()
-        self.__load_stylesheet()
 
     def refresh_view(self, data):
         """
-        Expects a list: [table_df, players_df, results_df]
+        Expects a list: [teams, players, results]
+
+        Only tabs that exist are refreshed; the data is kept so a tab
+        built lazily on first switch can populate itself.
         """
         teams, players, results = data
+        self._data = (teams, players, results)
 
         self.league_table_tab.update_table(teams)
-        self.top_scorers_tab.update_table(players)
-        self.results_tab.update_table(results)
+        if self.top_scorers_tab is not None:
+            self.top_scorers_tab.update_table(players)
+        if self.results_tab is not None:
+            self.results_tab.update_table(results)
 
     def __init_ui(self) -> None:
         main_layout = QVBoxLayout(self)
@@ -315,25 +309,54 @@ class StatisticsLeagueView(QWidget):
         top_bar.addWidget(title_label)
         top_bar.addStretch()
 
-        # Tabs
+        # Tabs: only the visible first tab is built here; the other two
+        # start as empty placeholders and are constructed on first switch.
         self.tabs: QTabWidget = QTabWidget()
         self.tabs.setObjectName("statsTabs")
 
         self.league_table_tab: LeagueTableWidget = LeagueTableWidget()
-        self.top_scorers_tab: TopScorersWidget = TopScorersWidget()
-        self.results_tab: ResultsWidget = ResultsWidget()
+        self.top_scorers_tab = None
+        self.results_tab = None
 
         self.league_table_tab.team_clicked.connect(self.team_clicked.emit)
 
         self.tabs.addTab(self.league_table_tab, "League Table")
-        self.tabs.addTab(self.top_scorers_tab, "Top Scorers")
-        self.tabs.addTab(self.results_tab, "Results")
+        self.tabs.addTab(QWidget(), "Top Scorers")
+        self.tabs.addTab(QWidget(), "Results")
+        self.tabs.currentChanged.connect(self.__ensure_tab)
 
         main_layout.addLayout(top_bar)
         main_layout.addWidget(self.tabs)
 
+    def __ensure_tab(self, index: int) -> None:
+        """Swap the placeholder at index for the real tab widget, once."""
+        if index == 1 and self.top_scorers_tab is None:
+            self.top_scorers_tab = TopScorersWidget()
+            if self._data is not None:
+                self.top_scorers_tab.update_table(self._data[1])
+            self.__replace_tab(index, self.top_scorers_tab, "Top Scorers")
+        elif index == 2 and self.results_tab is None:
+            self.results_tab = ResultsWidget()
+            if self._data is not None:
+                self.results_tab.update_table(self._data[2])
+            self.__replace_tab(index, self.results_tab, "Results")
+
+    def __replace_tab(self, index: int, widget: QWidget, label: str) -> None:
+        placeholder = self.tabs.widget(index)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, widget, label)
+        self.tabs.setCurrentIndex(index)
+        placeholder.deleteLater()
+
+    def showEvent(self, event):
+        # Stylesheet read deferred off the construction path; load_qss
+        # caches contents, so repeat shows are a no-op either way.
+        if not self._qss_loaded:
+            self._qss_loaded = True
+            self.__load_stylesheet()
+        super().showEvent(event)
+
     def __load_stylesheet(self):
-        qss_path = resource_path("./qss/statistics_league_view.qss")
-        if os.path.exists(qss_path):
-            with open(qss_path, "r") as f:
-                self.setStyleSheet(f.read())
+        qss = load_qss("./qss/statistics_league_view.qss")
+        if qss:
+            self.setStyleSheet(qss)
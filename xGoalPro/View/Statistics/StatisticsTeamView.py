@@ -1,11 +1,10 @@
-import os
-import ast
 from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QTabWidget, QTableWidget, QTableWidgetItem, QHeaderView
+    QTabWidget, QTableView, QAbstractItemView, QHeaderView
 )
-from ResourcePath import resource_path
+from ResourcePath import load_qss
+from View.Components.StatsTableModel import StatsTableModel, populate_guard
 
 
 class TeamPlayersWidget(QWidget):
@@ -36,13 +35,24 @@ class TeamPlayersWidget(QWidget):
         self.layout.addWidget(self.info_label)
 
         # Squad table
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["Name", "Position", "Date of Birth", "Nationality"])
+        self.table = QTableView()
+        self.model = StatsTableModel(
+            ["Name", "Position", "Date of Birth", "Nationality"],
+            ("name", "position", "dateOfBirth", "nationality"),
+            left_cols=(0, 1, 2, 3),
+            parent=self
+        )
+        self.table.setModel(self.model)
         header = self.table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.Stretch)
-        self.table.verticalHeader().setVisible(False)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        vheader = self.table.verticalHeader()
+        vheader.setVisible(False)
+        vheader.setSectionResizeMode(QHeaderView.Fixed)
+        vheader.setMinimumSectionSize(32)
+        vheader.setDefaultSectionSize(32)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.layout.addWidget(self.table)
 
         # Coach info label
@@ -72,13 +82,8 @@ class TeamPlayersWidget(QWidget):
         )
 
         # Update squad table
-        squad = team_json.get("squad", [])
-        self.table.setRowCount(len(squad))
-        for row_idx, player in enumerate(squad):
-            self.table.setItem(row_idx, 0, QTableWidgetItem(player.get("name", "")))
-            self.table.setItem(row_idx, 1, QTableWidgetItem(player.get("position", "")))
-            self.table.setItem(row_idx, 2, QTableWidgetItem(player.get("dateOfBirth", "")))
-            self.table.setItem(row_idx, 3, QTableWidgetItem(player.get("nationality", "")))
+        with populate_guard(self.table):
+            self.model.update(team_json.get("squad", []))
 
         # Update coach info
         coach = team_json.get("coach")
@@ -108,12 +113,26 @@ class TeamResultsWidget(QWidget):
         super().__init__()
         layout = QVBoxLayout(self)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["Home", "Score", "Away", "Date"])
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.table.verticalHeader().setVisible(False)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table = QTableView()
+        self.model = StatsTableModel(
+            ["Home", "Score", "Away", "Date"],
+            ("home_name", "score", "away_name", "date"),
+            parent=self
+        )
+        self.table.setModel(self.model)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        header.setSectionResizeMode(2, QHeaderView.Stretch)
+        self.table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        vheader = self.table.verticalHeader()
+        vheader.setVisible(False)
+        # Uniform 32px rows: Fixed mode lets Qt skip per-row height
+        # queries during paint and scrolling entirely.
+        vheader.setSectionResizeMode(QHeaderView.Fixed)
+        vheader.setMinimumSectionSize(32)
+        vheader.setDefaultSectionSize(32)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         layout.addWidget(self.table)
 
     def update_table(self, results) -> None:
@@ -121,34 +140,8 @@ class TeamResultsWidget(QWidget):
         results: list of dicts with keys:
             'home_name', 'home_emblem', 'score', 'away_name', 'away_emblem', 'date'
         """
-        self.table.setRowCount(len(results))
-
-        for row_idx, match in enumerate(results):
-            # Home team + emblem
-            home_item = QTableWidgetItem(match["home_name"])
-            home_item.setTextAlignment(Qt.AlignCenter)
-            home_item.setToolTip(match["home_name"])
-            self.table.setItem(row_idx, 0, home_item)
-
-            # Score
-            score_item = QTableWidgetItem(match["score"])
-            score_item.setTextAlignment(Qt.AlignCenter)
-            score_item.setToolTip(match["score"])
-            self.table.setItem(row_idx, 1, score_item)
-
-            # Away team + emblem
-            away_item = QTableWidgetItem(match["away_name"])
-            away_item.setTextAlignment(Qt.AlignCenter)
-            away_item.setToolTip(match["away_name"])
-            self.table.setItem(row_idx, 2, away_item)
-
-            # Date
-            date_item = QTableWidgetItem(match["date"])
-            date_item.setTextAlignment(Qt.AlignCenter)
-            date_item.setToolTip(match["date"])
-            self.table.setItem(row_idx, 3, date_item)
-
-            self.table.setRowHeight(row_idx, 32)
+        with populate_guard(self.table):
+            self.model.update(results)
 
 
 class StatisticsTeamView(QWidget):
@@ -167,9 +160,11 @@ class StatisticsTeamView(QWidget):
         back_to_league: Emitted when League Stats button is clicked.
 
     Methods:
-        refresh_view(data): Update all tabs with new data.
+        refresh_view(team, results, stats=None): Update all tabs with new data.
             Args:
-                data (list): [players_df, results_df, stats_dict]
+                team (dict): Team JSON with squad, coach and venue info.
+                results (list): Match result dicts for the team.
+                stats (dict): Optional aggregated metrics (not shown yet).
 
     Layout:
         - Top bar with navigation buttons + page title
@@ -187,11 +182,15 @@ class StatisticsTeamView(QWidget):
         self.__init_ui()
         self.__load_stylesheet()
 
-    def refresh_view(self, data) -> None:
-        """Called by controller: [players_df, results_df, stats_dict]"""
-        players_df, results_df = data
-        self.players_tab.update_table(players_df)
-        self.results_tab.update_table(results_df)
+    def refresh_view(self, team, results, stats=None) -> None:
+        """Called by the controller with the unpacked team payload.
+
+        The old single-list signature advertised three elements but only
+        ever unpacked two; explicit arguments make the mismatch
+        impossible and spare the caller the wrapper list.
+        """
+        self.players_tab.update_table(team)
+        self.results_tab.update_table(results)
 
     def __init_ui(self) -> None:
         main_layout = QVBoxLayout(self)
@@ -247,7 +246,6 @@ class StatisticsTeamView(QWidget):
         main_layout.addWidget(self.tabs)
 
     def __load_stylesheet(self):
-        qss_path = resource_path("./qss/statistics_team_view.qss")
-        if os.path.exists(qss_path):
-            with open(qss_path, "r") as f:
-                self.setStyleSheet(f.read())
+        qss = load_qss("./qss/statistics_team_view.qss")
+        if qss:
+            self.setStyleSheet(qss)
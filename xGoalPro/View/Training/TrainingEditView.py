@@ -4,8 +4,7 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt
 from datetime import datetime
-import os
-from ResourcePath import resource_path
+from ResourcePath import load_qss
 
 
 class TrainingEditView(QWidget):
@@ -98,10 +97,14 @@ class TrainingEditView(QWidget):
         form.addRow("Team name:", self.team_input)
 
         self.year_from = QSpinBox()
+        # Emit valueChanged once per finished edit, not per typed digit;
+        # the min/max sync slots otherwise fire on every keystroke.
+        self.year_from.setKeyboardTracking(False)
         self.year_from.setRange(2005, current_year)
         self.year_from.setValue(2015)
 
         self.year_to = QSpinBox()
+        self.year_to.setKeyboardTracking(False)
         self.year_to.setRange(2005, current_year)
         self.year_to.setValue(current_year)
 
@@ -132,21 +135,25 @@ class TrainingEditView(QWidget):
 
         # SVR parameter ranges
         self.c_min = QDoubleSpinBox()
+        self.c_min.setKeyboardTracking(False)
         self.c_min.setRange(0.001, 1000.0)
         self.c_min.setValue(0.1)
         self.c_min.setToolTip("Lower value = simpler model, less accurate; higher = more precise but may overfit.")
 
         self.c_max = QDoubleSpinBox()
+        self.c_max.setKeyboardTracking(False)
         self.c_max.setRange(0.001, 1000.0)
         self.c_max.setValue(10.0)
         self.c_max.setToolTip("Upper value = how complex the model is allowed to be.")
 
         self.gamma_min = QDoubleSpinBox()
+        self.gamma_min.setKeyboardTracking(False)
         self.gamma_min.setRange(0.0001, 1.0)
         self.gamma_min.setValue(0.001)
         self.gamma_min.setToolTip("Lower value = smoother predictions, less detail.")
 
         self.gamma_max = QDoubleSpinBox()
+        self.gamma_max.setKeyboardTracking(False)
         self.gamma_max.setRange(0.0001, 1.0)
         self.gamma_max.setValue(0.1)
         self.gamma_max.setToolTip("Higher value = more detail, but can overfit to training data.")
@@ -176,18 +183,26 @@ class TrainingEditView(QWidget):
         self.setLayout(main_layout)
 
         # === Value Constraints Between Paired Inputs ===
-        self.year_from.valueChanged.connect(lambda _: self.sync_min_max(self.year_from, self.year_to))
-        self.year_to.valueChanged.connect(lambda _: self.sync_min_max(self.year_from, self.year_to))
-        self.c_min.valueChanged.connect(lambda _: self.sync_min_max(self.c_min, self.c_max))
-        self.c_max.valueChanged.connect(lambda _: self.sync_min_max(self.c_min, self.c_max))
-        self.gamma_min.valueChanged.connect(lambda _: self.sync_min_max(self.gamma_min, self.gamma_max))
-        self.gamma_max.valueChanged.connect(lambda _: self.sync_min_max(self.gamma_min, self.gamma_max))
-
-        # === Load QSS ===
-        qss_path = resource_path("./qss/training_edit_view.qss")
-        if os.path.exists(qss_path):
-            with open(qss_path, "r") as f:
-                self.setStyleSheet(f.read())
+        self.year_from.valueChanged.connect(self._sync_year)
+        self.year_to.valueChanged.connect(self._sync_year)
+        self.c_min.valueChanged.connect(self._sync_c)
+        self.c_max.valueChanged.connect(self._sync_c)
+        self.gamma_min.valueChanged.connect(self._sync_gamma)
+        self.gamma_max.valueChanged.connect(self._sync_gamma)
+
+        # === Load QSS (cached in memory across instantiations) ===
+        qss = load_qss("./qss/training_edit_view.qss")
+        if qss:
+            self.setStyleSheet(qss)
+
+    def _sync_year(self, _value) -> None:
+        self.sync_min_max(self.year_from, self.year_to)
+
+    def _sync_c(self, _value) -> None:
+        self.sync_min_max(self.c_min, self.c_max)
+
+    def _sync_gamma(self, _value) -> None:
+        self.sync_min_max(self.gamma_min, self.gamma_max)
 
     def sync_min_max(self, min_widget, max_widget):
         """Ensure that the 'min' value is never greater than the 'max' value."""
@@ -197,6 +212,12 @@ class TrainingEditView(QWidget):
         if min_val > max_val:
             sender = self.sender()
             if sender == min_widget:
+                # Block the partner widget's valueChanged while applying
+                # the corrective value, otherwise one edit syncs twice.
+                blocked = max_widget.blockSignals(True)
                 max_widget.setValue(min_val)
+                max_widget.blockSignals(blocked)
             else:
+                blocked = min_widget.blockSignals(True)
                 min_widget.setValue(max_val)
+                min_widget.blockSignals(blocked)
@@ -1,7 +1,14 @@
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QTextEdit, QPushButton
-from PyQt5.QtCore import Qt
-import os
-from ResourcePath import resource_path
+from collections import deque
+from queue import Empty, SimpleQueue
+
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QPlainTextEdit, QPushButton
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QFontDatabase, QTextCursor
+from ResourcePath import load_qss
+
+# Shared cap for the log document and the pending buffer: neither can
+# outgrow the other, and both stay bounded over arbitrarily long runs.
+MAXIMUM_BLOCK_COUNT = 5000
 
 
 class TrainingLoadingView(QWidget):
@@ -20,7 +27,8 @@ class TrainingLoadingView(QWidget):
         - disable_button(): Disable the Back button while training is ongoing
 
     Styling:
-        - Uses external QSS file located at "./qss/training_loading_view.qss"
+        - Uses external QSS file located at "./qss/training_loading_view.qss",
+          read once per process through the load_qss cache.
     """
     def __init__(self):
         super().__init__()
@@ -39,8 +47,21 @@ class TrainingLoadingView(QWidget):
         self.label.setObjectName("trainingLabel")
 
         # === Log Text Area ===
-        self.log_box = QTextEdit()
+        # QPlainTextEdit: the rich-text machinery of QTextEdit is wasted
+        # on a write-only log and makes appends much more expensive.
+        self.log_box = QPlainTextEdit()
         self.log_box.setReadOnly(True)
+        # Append-only log: no undo stack to maintain, and the fixed-pitch
+        # system font keeps line-metric work trivial.
+        self.log_box.setUndoRedoEnabled(False)
+        self.log_box.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        # The #logBox stylesheet already pads the widget; no need for the
+        # document to add its own margin on every layout pass.
+        self.log_box.document().setDocumentMargin(0)
+        # Bounded document: once the cap is hit the oldest block is
+        # evicted per append, so grid-search log spam can neither grow
+        # memory nor slow appends over a long run.
+        self.log_box.setMaximumBlockCount(MAXIMUM_BLOCK_COUNT)
         self.log_box.setObjectName("logBox")
 
         # === Back Button ===
@@ -55,20 +76,103 @@ class TrainingLoadingView(QWidget):
 
         self.setLayout(layout)
 
-        # === Load stylesheet ===
-        qss_path = resource_path("./qss/training_loading_view.qss")
-        if os.path.exists(qss_path):
-            with open(qss_path, "r") as f:
-                self.setStyleSheet(f.read())
+        # Incoming log lines land on a thread-safe queue; the flush moves
+        # them onto the GUI-side deque and appends them as one batch per
+        # timer tick, so a burst of N messages costs one relayout, not N.
+        # Only the GUI thread ever touches the deque, whose maxlen keeps
+        # a long hidden stretch from outgrowing what the document would
+        # keep anyway. The timer only runs while training is active
+        # (start_logging/stop_logging) so an idle app gets no 20 Hz
+        # wakeups.
+        self._log_queue = SimpleQueue()
+        self._pending = deque(maxlen=MAXIMUM_BLOCK_COUNT)
+        self._cursor = self.log_box.textCursor()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.timeout.connect(self._flush_log)
+
+        # === Load QSS (cached in memory across instantiations) ===
+        qss = load_qss("./qss/training_loading_view.qss")
+        if qss:
+            self.setStyleSheet(qss)
 
     # === Public methods ===
     def append_log(self, message: str) -> None:
-        self.log_box.append(message)
+        """Queue a plain-text log line for the next flush.
+
+        The message is inserted verbatim — no HTML parsing ever happens
+        on this path, so it stays on the fast insertText route. Use
+        append_html for the rare styled line.
+
+        Safe to call from any thread: producers only touch the
+        SimpleQueue, which the GUI thread drains during flushes, so
+        training workers can log without extra marshaling.
+        """
+        self._log_queue.put_nowait(message)
+
+    def append_html(self, html: str) -> None:
+        """Insert a rich-text log line immediately (GUI thread only).
+
+        Meant for occasional styled lines; anything high-volume belongs
+        on the plain-text append_log path. Pending plain lines are
+        drained first so ordering is preserved.
+        """
+        self._drain_queue()
+        if self._pending:
+            self._cursor.movePosition(QTextCursor.End)
+            self._cursor.insertText("\n".join(self._pending) + "\n")
+            self._pending.clear()
+        self._cursor.movePosition(QTextCursor.End)
+        self._cursor.insertHtml(html)
+        self._cursor.insertText("\n")
+        scrollbar = self.log_box.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
 
     def clear_log(self) -> None:
+        self._drain_queue()
+        self._pending.clear()
         self.log_box.clear()
+        self._cursor = self.log_box.textCursor()
+
+    def _drain_queue(self) -> None:
+        """Move queued lines onto the GUI-side buffer (GUI thread only)."""
+        pending = self._pending
+        get_nowait = self._log_queue.get_nowait
+        while True:
+            try:
+                pending.append(get_nowait())
+            except Empty:
+                break
+
+    def _flush_log(self) -> None:
+        self._drain_queue()
+        # While the view is hidden (user navigated away mid-training)
+        # lines stay in the buffer — relayouting invisible text is pure
+        # waste; showEvent drains everything in one append.
+        if self._pending and self.log_box.isVisible():
+            # One End-positioned insertText per flush skips append()'s
+            # per-call block/autoscroll handling; the view is scrolled to
+            # the bottom once after the whole batch lands.
+            self._cursor.movePosition(QTextCursor.End)
+            self._cursor.insertText("\n".join(self._pending) + "\n")
+            self._pending.clear()
+            scrollbar = self.log_box.verticalScrollBar()
+            scrollbar.setValue(scrollbar.maximum())
+
+    def showEvent(self, event) -> None:
+        self._flush_log()
+        super().showEvent(event)
+
+    def start_logging(self) -> None:
+        """Run the flush timer for the duration of a training run."""
+        self._flush_timer.start(50)
+
+    def stop_logging(self) -> None:
+        """Stop the flush timer and drain whatever is still buffered."""
+        self._flush_timer.stop()
+        self._flush_log()
 
     def enable_button(self) -> None:
+        self.stop_logging()
         self.back_button.setEnabled(True)
 
     def disable_button(self) -> None:
@@ -1,42 +1,102 @@
 import sys
+import os
+import logging
 import threading
 import asyncio
 from qasync import QEventLoop
 
+from PyQt5.QtCore import QThreadPool
 from PyQt5.QtWidgets import QApplication
 
 from Application import App
+from ResourcePath import resource_path
+
+
+# Stylesheets applied once on the QApplication instead of per view;
+# per-widget setStyleSheet forces Qt to re-parse the rules and invalidate
+# the style of the whole subtree every time the view is built.
+GLOBAL_QSS_FILES = (
+    "./qss/prediction_match_view.qss",
+    "./qss/team_hub_view.qss",
+    "./qss/statistics_index.qss",
+)
+
+
+# Shutdown diagnostics go through a logger; unlike print, the handler
+# does not force a flush per call, which matters in frozen builds where
+# console writes can block.
+logger = logging.getLogger("xgoalpro.shutdown")
+logger.addHandler(logging.StreamHandler(sys.stderr))
+logger.setLevel(logging.INFO)
+
+
+def load_global_qss() -> str:
+    """Concatenate the shared .qss files into one application stylesheet."""
+    parts = []
+    for rel_path in GLOBAL_QSS_FILES:
+        qss_path = resource_path(rel_path)
+        if os.path.exists(qss_path):
+            with open(qss_path, "r") as f:
+                parts.append(f.read())
+    return "\n".join(parts)
 
 
 if __name__ == "__main__":
     try:
         app = QApplication(sys.argv)
+        app.setStyleSheet(load_global_qss())
+        # qasync's QEventLoop must be the running loop implementation —
+        # it multiplexes asyncio over the Qt event dispatcher, so
+        # alternative loops (uvloop etc.) cannot be swapped in here.
         loop = QEventLoop(app)
         asyncio.set_event_loop(loop)
+        # Debug instrumentation (slow-callback logging, task tracking)
+        # times every callback; keep it off unless explicitly requested,
+        # even if PYTHONASYNCIODEBUG leaked into the environment.
+        loop.set_debug(bool(os.environ.get("XGOALPRO_DEBUG")))
+        # On Python 3.12+ coroutines that finish without suspending skip
+        # the task-scheduling round-trip entirely; older interpreters
+        # just keep the default factory.
+        if hasattr(asyncio, "eager_task_factory"):
+            loop.set_task_factory(asyncio.eager_task_factory)
 
         # Initialize the application asynchronously
         main_app = App()
 
-        app.aboutToQuit.connect(loop.stop)
+        # Quit is signalled through an asyncio.Event so close_app is
+        # awaited while the loop is still running, instead of restarting
+        # a stopped loop with run_until_complete during teardown.
+        app_close_event = asyncio.Event()
+        app.aboutToQuit.connect(app_close_event.set)
+
+        async def run_until_quit():
+            await app_close_event.wait()
+            await main_app.close_app()
 
         with loop:
             try:
-                loop.run_forever()
+                loop.run_until_complete(run_until_quit())
             finally:
-                loop.run_until_complete(main_app.close_app())
-                loop.close()
-                print(">>> Checking pending tasks & threads on exit")
+                logger.info(">>> Checking pending tasks & threads on exit")
 
-                # Any asyncio tasks still alive?
-                pending = asyncio.all_tasks(loop)
+                # Single pass over still-live tasks; asyncio.wait with a
+                # timeout bounds shutdown instead of gather potentially
+                # blocking forever on a task that ignores cancellation.
+                pending = [t for t in asyncio.all_tasks(loop) if not t.done()]
                 if pending:
-                    print("Pending asyncio tasks:", pending)
+                    logger.info("Pending asyncio tasks: %s", pending)
                     for task in pending:
                         task.cancel()
-                    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+                    loop.run_until_complete(asyncio.wait(pending, timeout=2.0))
+                loop.close()
+
+                # Let queued/running image decodes (PixmapDecodeTask)
+                # finish before teardown; a worker emitting on an
+                # already-collected signal holder aborts the process.
+                QThreadPool.globalInstance().waitForDone()
 
                 # Any threads still running?
-                print("Active threads:", threading.enumerate())
+                logger.info("Active threads: %s", threading.enumerate())
     except asyncio.exceptions.CancelledError:
         pass  # This is normal when closing the application
     except Exception as e: